@@ -1,10 +1,14 @@
 from __future__ import annotations
 import math
+import os
 import statistics
 import random
 import ast
+import functools
+import itertools
 import operator
 from typing import List
+import numpy as np
 from fastmcp import FastMCP
 
 # Initialize the Server
@@ -13,6 +17,12 @@ mcp = FastMCP("Unified-Math-Tools-Server")
 # Helper Functions (Internal Use)
 def _as_number(x) -> float:
     """Converts input to a float, raises TypeError if invalid."""
+    # Exact-type checks first: the common case skips isinstance's MRO walk.
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
     if isinstance(x, (int, float)):
         return float(x)
     if isinstance(x, str):
@@ -21,6 +31,8 @@ def _as_number(x) -> float:
 
 def _as_int(x) -> int:
     """Converts input to an integer, raises ValueError if not an integer."""
+    if type(x) is int:
+        return x
     val = _as_number(x)
     if not val.is_integer():
         raise ValueError("Expected integer")
@@ -32,66 +44,117 @@ def _as_list(data: List[float]) -> List[float]:
         raise ValueError("Input list cannot be empty")
     return [_as_number(x) for x in data]
 
+def _as_array(data: List[float]) -> np.ndarray:
+    """Ensures input is a non-empty 1-D float64 array."""
+    if not data:
+        raise ValueError("Input list cannot be empty")
+    try:
+        arr = np.asarray(data)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.dtype.kind in "biuf":
+        arr = arr.astype(np.float64, copy=False)
+    else:
+        # Strings, None and other objects go through the validated per-element path.
+        arr = np.asarray(_as_list(data), dtype=np.float64)
+    if arr.ndim != 1:
+        raise TypeError(f"Invalid number list: {data}")
+    return arr
+
+# Trusted deployments can skip input sanitization with MCP_SKIP_VALIDATION=1;
+# _as_number is swapped for the bare float builtin once, at import time.
+# _as_int stays validated so non-integers are still rejected rather than truncated.
+if os.environ.get("MCP_SKIP_VALIDATION") == "1":
+    _as_number = float
+
+def _as_angle_array(data: List[float]) -> np.ndarray:
+    """Like _as_array, but rejects infinities the way math.sin/cos/tan do."""
+    arr = _as_array(data)
+    if np.isinf(arr).any():
+        raise ValueError("math domain error")
+    return arr
+
+@functools.lru_cache(maxsize=32)
+def _ln(base: float) -> float:
+    """Returns ln(base), cached since callers tend to reuse the same base."""
+    return math.log(base)
+
+# Above this many elements NumPy's vectorized pairwise sum beats math.fsum
+_VECTOR_THRESHOLD = 10_000
+
+# Factorials 0! .. 1024!, precomputed so repeated small-n lookups are O(1)
+_FACT_CACHE = list(itertools.accumulate(range(1, 1025), operator.mul, initial=1))
+
+# Shared NumPy generator (PCG64) for the random tools
+_RNG = np.random.default_rng()
+_INT64 = np.iinfo(np.int64)
+# Upper bound on random_ints_batch's n, so one call cannot request an unbounded allocation
+_MAX_BATCH = 1_000_000
+
+# Angle conversion factors, same values math.radians/math.degrees use internally
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
 #1. Basic Arithmetic (Add, Subtract, Multiply, Divide, Modulo, Power)
 @mcp.tool
-async def add(numbers: List[float]) -> float:
+def add(numbers: List[float]) -> float:
     """Adds multiple numbers."""
-    return sum(_as_list(numbers))
+    if len(numbers) > _VECTOR_THRESHOLD:
+        return float(_as_array(numbers).sum())
+    nums = _as_list(numbers)
+    try:
+        return math.fsum(nums)
+    except (OverflowError, ValueError):
+        # fsum rejects intermediate overflow and inf - inf; plain sum gives inf/nan.
+        return sum(nums)
 
 @mcp.tool
-async def multiply(numbers: List[float]) -> float:
+def multiply(numbers: List[float]) -> float:
     """Multiplies multiple numbers."""
-    result = 1.0
-    for n in _as_list(numbers):
-        result *= n
-    return result
+    return float(_as_array(numbers).prod())
 
 @mcp.tool
-async def subtract(numbers: List[float]) -> float:
+def subtract(numbers: List[float]) -> float:
     """Subtracts numbers sequentially: a - b - c ..."""
-    nums = _as_list(numbers)
-    result = nums[0]
-    for n in nums[1:]:
-        result -= n
-    return result
+    arr = _as_array(numbers)
+    return float(arr[0] - arr[1:].sum())
 
 @mcp.tool
-async def divide(numbers: List[float]) -> float:
+def divide(numbers: List[float]) -> float:
     """Divides numbers sequentially: a / b / c ..."""
     nums = _as_list(numbers)
-    result = nums[0]
-    for n in nums[1:]:
-        if n == 0:
-            raise ValueError("Division by zero")
-        result /= n
-    return result
+    tail = nums[1:]
+    if 0.0 in tail:
+        raise ValueError("Division by zero")
+    return functools.reduce(operator.truediv, tail, nums[0])
 
+# Register the same function under its legacy name instead of a second copy.
+mcp.tool(divide.fn, name="divide_multiple")
 
 @mcp.tool
-async def divide_multiple(numbers: List[float]) -> float:
-    """Divides numbers sequentially: a / b / c ..."""
-    nums = _as_list(numbers)
-    result = nums[0]
-    for n in nums[1:]:
-        if n == 0:
-            raise ValueError("Division by zero")
-        result /= n
-    return result
-
-@mcp.tool
-async def modulo(a: float, b: float) -> float:
+def modulo(a: float, b: float) -> float:
     """Calculates the remainder of division (a % b)."""
-    return _as_number(a) % _as_number(b)
+    return float(a) % float(b)
 
 @mcp.tool
-async def power(base: float, exponent: float) -> float:
+def power(base: float, exponent: float) -> float:
     """Calculates the base raised to the power of the exponent."""
-    return math.pow(_as_number(base), _as_number(exponent))
+    b = _as_number(base)
+    e = _as_number(exponent)
+    if e == 0.5 and b > 0:
+        return math.sqrt(b)
+    # ** would return a complex number / raise ZeroDivisionError here
+    if math.isfinite(b) and math.isfinite(e):
+        if b < 0 and not e.is_integer():
+            raise ValueError("Cannot raise a negative number to a fractional power.")
+        if b == 0 and e < 0:
+            raise ValueError("Cannot raise zero to a negative power.")
+    return b ** e
 
 # 2. Advanced Math (Square Root, Logarithms) 
 
 @mcp.tool
-async def sqrt(x: float) -> float:
+def sqrt(x: float) -> float:
     """Calculates the square root of a positive number."""
     val = _as_number(x)
     if val < 0:
@@ -99,7 +162,7 @@ async def sqrt(x: float) -> float:
     return math.sqrt(val)
 
 @mcp.tool
-async def log(x: float, base: float = 2.718281828) -> float:
+def log(x: float, base: float = 2.718281828) -> float:
     """
     Calculates the logarithm of x with a specific base.
     Defaults to Natural Log (base e) if base is not provided.
@@ -108,10 +171,14 @@ async def log(x: float, base: float = 2.718281828) -> float:
     b = _as_number(base)
     if val <= 0:
         raise ValueError("Logarithm input must be positive.")
-    return math.log(val, b)
+    if b == 10.0:
+        return math.log10(val)
+    if b == 2.0:
+        return math.log2(val)
+    return math.log(val) / _ln(b)
 
 @mcp.tool
-async def log10(x: float) -> float:
+def log10(x: float) -> float:
     """Calculates the base-10 logarithm of x."""
     val = _as_number(x)
     if val <= 0:
@@ -121,133 +188,178 @@ async def log10(x: float) -> float:
 #3. Number Theory(Factorial, GCD, LCM)
 
 @mcp.tool
-async def factorial(x: int) -> int:
+def factorial(x: int) -> int:
     """Calculates the factorial of a non-negative integer (x!)."""
     n = _as_int(x)
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers.")
+    if n < len(_FACT_CACHE):
+        return _FACT_CACHE[n]
     return math.factorial(n)
 
 @mcp.tool
-async def gcd(a: int, b: int) -> int:
+def gcd(a: int, b: int) -> int:
     """Calculates the Greatest Common Divisor (GCD) of two integers."""
     return math.gcd(_as_int(a), _as_int(b))
 
 @mcp.tool
-async def lcm(a: int, b: int) -> int:
+def lcm(a: int, b: int) -> int:
     """Calculates the Least Common Multiple (LCM) of two integers."""
     return math.lcm(_as_int(a), _as_int(b))
 
 # 4. Trigonometry(Sine, Cosine, Tangent, Degree-Radian Conversion)
 
 @mcp.tool
-async def sin(x: float) -> float:
+def sin(x: float) -> float:
     """Calculates the sine of x (input in radians)."""
     return math.sin(_as_number(x))
 
 @mcp.tool
-async def cos(x: float) -> float:
+def cos(x: float) -> float:
     """Calculates the cosine of x (input in radians)."""
     return math.cos(_as_number(x))
 
 @mcp.tool
-async def tan(x: float) -> float:
+def tan(x: float) -> float:
     """Calculates the tangent of x (input in radians)."""
     return math.tan(_as_number(x))
 
 @mcp.tool
-async def degrees_to_radians(degrees: float) -> float:
+def sin_batch(xs: List[float]) -> List[float]:
+    """Calculates the sine of each value in a list (inputs in radians)."""
+    return np.sin(_as_angle_array(xs)).tolist()
+
+@mcp.tool
+def cos_batch(xs: List[float]) -> List[float]:
+    """Calculates the cosine of each value in a list (inputs in radians)."""
+    return np.cos(_as_angle_array(xs)).tolist()
+
+@mcp.tool
+def tan_batch(xs: List[float]) -> List[float]:
+    """Calculates the tangent of each value in a list (inputs in radians)."""
+    return np.tan(_as_angle_array(xs)).tolist()
+
+@mcp.tool
+def degrees_to_radians(degrees: float) -> float:
     """Converts an angle from degrees to radians."""
-    return math.radians(_as_number(degrees))
+    return _as_number(degrees) * _DEG2RAD
 
 @mcp.tool
-async def radians_to_degrees(radians: float) -> float:
+def radians_to_degrees(radians: float) -> float:
     """Converts an angle from radians to degrees."""
-    return math.degrees(_as_number(radians))
+    return _as_number(radians) * _RAD2DEG
 
 #5. Statistics (Mean, Median, Standard Deviation, Variance)
 
 @mcp.tool
-async def mean(data: list[float]) -> float:
+def mean(data: list[float]) -> float:
     """Calculates the arithmetic mean (average) of a list of numbers."""
     if not data:
         raise ValueError("Input list cannot be empty.")
-    return statistics.mean(data)
+    return float(_as_array(data).mean())
 
 @mcp.tool
-async def median(data: list[float]) -> float:
+def median(data: list[float]) -> float:
     """Calculates the median (middle value) of a list of numbers."""
     if not data:
         raise ValueError("Input list cannot be empty.")
     return statistics.median(data)
 
 @mcp.tool
-async def stdev(data: list[float]) -> float:
+def stdev(data: list[float]) -> float:
     """Calculates the standard deviation of a sample."""
     if len(data) < 2:
         raise ValueError("Standard deviation requires at least two data points.")
-    return statistics.stdev(data)
+    return float(_as_array(data).std(ddof=1))
 
 @mcp.tool
-async def variance(data: list[float]) -> float:
+def variance(data: list[float]) -> float:
     """Calculates the variance of a sample."""
     if len(data) < 2:
         raise ValueError("Variance requires at least two data points.")
-    return statistics.variance(data)
+    return float(_as_array(data).var(ddof=1))
 
 #6. Geometry(Hypotenuse, Distance, Area Calculations)
 @mcp.tool
-async def hypotenuse(a: float, b: float) -> float:
+def hypotenuse(a: float, b: float) -> float:
     """Calculates the length of the hypotenuse of a right triangle (sqrt(a^2 + b^2))."""
-    return math.hypot(_as_number(a), _as_number(b))
+    return math.hypot(float(a), float(b))
 
 @mcp.tool
-async def distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
+def distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculates the Euclidean distance between two points (x1, y1) and (x2, y2)."""
-    return math.dist((_as_number(x1), _as_number(y1)), (_as_number(x2), _as_number(y2)))
+    return math.hypot(float(x1) - float(x2), float(y1) - float(y2))
+
+@mcp.tool
+def distances_2d_batch(xs1: List[float], ys1: List[float], xs2: List[float], ys2: List[float]) -> List[float]:
+    """Calculates the Euclidean distances between many point pairs, given one list per coordinate."""
+    x1, y1, x2, y2 = (_as_array(v) for v in (xs1, ys1, xs2, ys2))
+    if not len(x1) == len(y1) == len(x2) == len(y2):
+        raise ValueError("Coordinate lists must all have the same length.")
+    return np.hypot(x1 - x2, y1 - y2).tolist()
 
 @mcp.tool
-async def circle_area(radius: float) -> float:
+def circle_area(radius: float) -> float:
     """Calculates the area of a circle given its radius."""
     r = _as_number(radius)
     if r < 0:
         raise ValueError("Radius cannot be negative.")
-    return math.pi * (r ** 2)
+    return math.pi * (r * r)
 
 #7. Utilities & Rounding(Absolute Value, Floor, Ceil, Round, Random Number Generation, Constants)
 
 @mcp.tool
-async def abs_val(x: float) -> float:
+def abs_val(x: float) -> float:
     """Calculates the absolute value of x."""
     return abs(_as_number(x))
 
 @mcp.tool
-async def floor(x: float) -> int:
+def floor(x: float) -> int:
     """Rounds a number DOWN to the nearest integer."""
     return math.floor(_as_number(x))
 
 @mcp.tool
-async def ceil(x: float) -> int:
+def ceil(x: float) -> int:
     """Rounds a number UP to the nearest integer."""
     return math.ceil(_as_number(x))
 
 @mcp.tool
-async def round_num(x: float, digits: int = 0) -> float:
+def round_num(x: float, digits: int = 0) -> float:
     """Rounds a number to a specified number of decimal digits."""
     return round(_as_number(x), _as_int(digits))
 
 @mcp.tool
-async def random_int(min_val: int, max_val: int) -> int:
+def random_int(min_val: int, max_val: int) -> int:
     """Generates a random integer between min_val and max_val (inclusive)."""
-    return random.randint(_as_int(min_val), _as_int(max_val))
-
-@mcp.tool
-async def get_pi() -> float:
+    lo, hi = _as_int(min_val), _as_int(max_val)
+    if lo > hi:
+        raise ValueError("min_val cannot be greater than max_val.")
+    if lo < _INT64.min or hi > _INT64.max:
+        # NumPy is limited to int64; the stdlib handles arbitrary-size bounds.
+        return random.randint(lo, hi)
+    return _RNG.integers(lo, hi, endpoint=True).item()
+
+@mcp.tool
+def random_ints_batch(min_val: int, max_val: int, n: int) -> List[int]:
+    """Generates n random integers between min_val and max_val (inclusive)."""
+    lo, hi, count = _as_int(min_val), _as_int(max_val), _as_int(n)
+    if lo > hi:
+        raise ValueError("min_val cannot be greater than max_val.")
+    if count < 0:
+        raise ValueError("n cannot be negative.")
+    if count > _MAX_BATCH:
+        raise ValueError(f"n cannot be greater than {_MAX_BATCH}.")
+    if lo < _INT64.min or hi > _INT64.max:
+        raise ValueError("Batch bounds must fit in a 64-bit signed integer.")
+    return _RNG.integers(lo, hi, size=count, endpoint=True, dtype=np.int64).tolist()
+
+@mcp.tool
+def get_pi() -> float:
     """Returns the value of Pi."""
     return math.pi
 
 @mcp.tool
-async def get_e() -> float:
+def get_e() -> float:
     """Returns the value of Euler's number e."""
     return math.e
 
@@ -256,21 +368,24 @@ async def get_e() -> float:
 #8. Distance between Points (Absolute Difference,Euclidean Distance in 2D/3D, Manhattan Distance)
 
 @mcp.tool
-async def distance_3d(x1: float, y1: float, z1: float, x2: float, y2: float, z2: float) -> float:
+def distance_3d(x1: float, y1: float, z1: float, x2: float, y2: float, z2: float) -> float:
     """Calculates the Euclidean distance between two points (x1, y1, z1) and (x2, y2, z2)."""
-    return math.dist((_as_number(x1), _as_number(y1), _as_number(z1)), (_as_number(x2), _as_number(y2), _as_number(z2)))
+    return math.hypot(float(x1) - float(x2), float(y1) - float(y2), float(z1) - float(z2))
 
 @mcp.tool
-async def manhattan_distance(point1: List[float], point2: List[float]) -> float:
+def manhattan_distance(point1: List[float], point2: List[float]) -> float:
     """Calculates the Manhattan distance between two points in n-dimensional space."""
-    p1 = _as_list(point1)
-    p2 = _as_list(point2)
-    if len(p1) != len(p2):
+    p1 = _as_array(point1)
+    p2 = _as_array(point2)
+    if p1.shape != p2.shape:
         raise ValueError("Points must have the same number of dimensions.")
-    return sum(abs(a - b) for a, b in zip(p1, p2))
+    # Reuse one buffer for the difference and its absolute value.
+    diff = np.subtract(p1, p2)
+    np.abs(diff, out=diff)
+    return float(diff.sum())
 
 @mcp.tool
-async def absolute_difference(a: float, b: float) -> float:
+def absolute_difference(a: float, b: float) -> float:
     """Calculates the absolute difference between two numbers."""
     return abs(_as_number(a) - _as_number(b))
 